@@ -1,4 +1,4 @@
-# Copyright 2013, 2014, 2022, 2023 Richard Dymond (rjdymond@gmail.com)
+# Copyright 2013, 2014, 2022-2024 Richard Dymond (rjdymond@gmail.com)
 #
 # This file is part of SkoolKit.
 #
@@ -177,6 +177,8 @@ class AudioWriter:
         header.extend((16, 0))                         # bits per sample
         header.extend(b'data')
         header.extend(self._to_int32(data_length))     # length of data chunk
+        data = bytearray(data_length)
+        data[0::2] = bytes(s & 255 for s in samples)
+        data[1::2] = bytes(s // 256 for s in samples)
         audio_file.write(header)
-        for sample in samples:
-            audio_file.write(bytes((sample & 255, sample // 256)))
+        audio_file.write(data)
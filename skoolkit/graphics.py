@@ -1,4 +1,4 @@
-# Copyright 2008-2021 Richard Dymond (rjdymond@gmail.com)
+# Copyright 2008-2024 Richard Dymond (rjdymond@gmail.com)
 #
 # This file is part of SkoolKit.
 #
@@ -15,7 +15,7 @@
 # SkoolKit. If not, see <http://www.gnu.org/licenses/>.
 
 # Byte flip table
-FLIP = (
+FLIP = bytes((
     0, 128, 64, 192, 32, 160, 96, 224, 16, 144, 80, 208, 48, 176, 112, 240,
     8, 136, 72, 200, 40, 168, 104, 232, 24, 152, 88, 216, 56, 184, 120, 248,
     4, 132, 68, 196, 36, 164, 100, 228, 20, 148, 84, 212, 52, 180, 116, 244,
@@ -32,7 +32,7 @@ FLIP = (
     11, 139, 75, 203, 43, 171, 107, 235, 27, 155, 91, 219, 59, 187, 123, 251,
     7, 135, 71, 199, 39, 167, 103, 231, 23, 151, 87, 215, 55, 183, 119, 247,
     15, 143, 79, 207, 47, 175, 111, 239, 31, 159, 95, 223, 63, 191, 127, 255
-)
+))
 
 class Udg:
     """Initialise the UDG.
@@ -52,11 +52,33 @@ class Udg:
         return 'Udg({0}, {1}, {2})'.format(self.attr, self.data, self.mask)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, Udg):
             return self.attr == other.attr and self.data == other.data and self.mask == other.mask
         return False
 
     def _rotate_tile(self, tile_data, backwards=0):
+        if len(tile_data) != 8:
+            return self._rotate_rows(tile_data, backwards)
+        # Transpose the 8x8 tile as a 64-bit integer (row 0 in the top byte),
+        # reversing the rows before (clockwise) or after (anticlockwise)
+        if backwards:
+            x = int.from_bytes(bytes(tile_data), 'big')
+        else:
+            x = int.from_bytes(bytes(tile_data[::-1]), 'big')
+        t = (x ^ (x >> 7)) & 0x00AA00AA00AA00AA
+        x ^= t ^ (t << 7)
+        t = (x ^ (x >> 14)) & 0x0000CCCC0000CCCC
+        x ^= t ^ (t << 14)
+        t = (x ^ (x >> 28)) & 0x00000000F0F0F0F0
+        x ^= t ^ (t << 28)
+        rotated = list(x.to_bytes(8, 'big'))
+        if backwards:
+            rotated.reverse()
+        return rotated
+
+    def _rotate_rows(self, tile_data, backwards):
         rotated = []
         if backwards:
             b = 1
@@ -88,9 +110,9 @@ class Udg:
                      horizontally and vertically.
         """
         if flip & 1:
-            self.data = [FLIP[b] for b in self.data]
+            self.data = list(bytes(self.data).translate(FLIP))
             if self.mask:
-                self.mask = [FLIP[b] for b in self.mask]
+                self.mask = list(bytes(self.mask).translate(FLIP))
         if flip & 2:
             self.data.reverse()
             if self.mask:
@@ -112,9 +134,7 @@ class Udg:
     # API
     def copy(self):
         """Return a deep copy of the UDG."""
-        if self.mask:
-            return Udg(self.attr, self.data[:], self.mask[:])
-        return Udg(self.attr, self.data[:])
+        return Udg(self.attr, self.data[:], self.mask[:] if self.mask else None)
 
 class Frame:
     """Create a frame of a still or animated image.
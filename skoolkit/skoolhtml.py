@@ -1,4 +1,4 @@
-# Copyright 2008-2023 Richard Dymond (rjdymond@gmail.com)
+# Copyright 2008-2024 Richard Dymond (rjdymond@gmail.com)
 #
 # This file is part of SkoolKit.
 #
@@ -23,6 +23,7 @@ import posixpath
 import os.path
 from os.path import isfile, isdir, basename
 from collections import defaultdict
+from functools import lru_cache
 import re
 from io import StringIO
 
@@ -50,6 +51,14 @@ UDG_IMAGE_PATH = 'UDGImagePath'
 def join(*path_components):
     return '/'.join([c for c in path_components if c.replace('/', '')])
 
+# The parsed default ref file is shared by all HtmlWriters, and so must be
+# treated as read-only
+@lru_cache(maxsize=1)
+def _get_defaults(ref_file):
+    ref_parser = RefParser()
+    ref_parser.parse(StringIO(ref_file))
+    return ref_parser
+
 class HtmlWriter:
     """Converts a skool file and its associated ref files to HTML.
 
@@ -65,9 +74,9 @@ class HtmlWriter:
         self.parser = skool_parser
         self.ref_parser = ref_parser
         skool_parser.make_replacements(ref_parser)
-        self.defaults = RefParser()
-        self.defaults.parse(StringIO(REF_FILE))
+        self.defaults = _get_defaults(REF_FILE)
         self.file_info = file_info
+        self._relpaths = {}
 
         colours = self._parse_colours(self.get_dictionary('Colours'))
         iw_config = self.get_dictionary('ImageWriter')
@@ -466,7 +475,10 @@ class HtmlWriter:
         return self.file_info.file_exists(fname)
 
     def relpath(self, cwd, target):
-        return posixpath.relpath(target, cwd)
+        key = (cwd, target)
+        if key not in self._relpaths:
+            self._relpaths[key] = posixpath.relpath(target, cwd)
+        return self._relpaths[key]
 
     def asm_fname(self, address, path=''):
         return posixpath.normpath(join(path, format_template(self.asm_fname_template, 'CodeFiles', address=address)))
@@ -1249,6 +1261,8 @@ class TemplateFormatter:
     # Component API
     def __init__(self, templates):
         self.templates = templates
+        self._template_lines = {}
+        self._plain_templates = set()
 
     # Component API
     def format_template(self, page_id, name, fields):
@@ -1260,6 +1274,8 @@ class TemplateFormatter:
         :return: The text of the formatted template.
         """
         tname, lines = self._get_template(page_id, name)
+        if tname in self._plain_templates:
+            return format_template(self.templates[tname], tname, **fields)
         try:
             lines = self._process_include(page_id, lines, fields)
         except SkoolKitError as e:
@@ -1275,6 +1291,9 @@ class TemplateFormatter:
         return format_template('\n'.join(lines), tname, **fields)
 
     def _get_template(self, page_id, name):
+        template = self._template_lines.get((page_id, name))
+        if template:
+            return template
         tname = page_id
         if name != T_LAYOUT:
             tname += '-' + name
@@ -1283,9 +1302,13 @@ class TemplateFormatter:
         if tname not in self.templates:
             tname = name
         try:
-            return tname, self.templates[tname].split('\n')
+            template = (tname, self.templates[tname].split('\n'))
         except KeyError as e:
             raise SkoolKitError("'{}' template does not exist".format(e.args[0]))
+        if not any(self._html_template_directive(line) for line in template[1]):
+            self._plain_templates.add(tname)
+        self._template_lines[(page_id, name)] = template
+        return template
 
     def _process_include(self, page_id, lines, fields):
         while 1:
@@ -31,6 +31,8 @@ from skoolkit.snapshot import FRAME_DURATIONS
 
 _map_cache = {}
 
+_params_re = {}
+
 _writer = None
 
 _cwd = ()
@@ -47,6 +49,9 @@ DELIMITERS = {
 
 ZX_CHARS = {94: 8593, 96: 163, 127: 169}
 
+# Maximum length of macro text quoted in a parameter error message
+ERR_TEXT_LEN = 10
+
 INTEGER = r'(\d+|\$[0-9a-fA-F]+)'
 
 PARAM_NAME = '[a-z]+'
@@ -174,13 +179,19 @@ def parse_ints(text, index=0, num=0, defaults=(), names=(), fields=None):
             params = _format_params(params, params, **fields)
         return [end] + get_params(params, num, defaults, names, text[index:end], False)
     if names:
-        pattern = PARAMS.format(NAMED_PARAM, len(names) - 1)
+        params_re = _get_params_re(NAMED_PARAM, len(names))
     elif num > 0:
-        pattern = PARAMS.format(INTEGER, num - 1)
+        params_re = _get_params_re(INTEGER, num)
     else:
         return [index]
-    params = re.match(pattern, text[index:]).group()
-    return [index + len(params)] + get_params(params, num, defaults, names, text[index:])
+    params = params_re.match(text, index).group()
+    # get_params() needs only enough text to tell whether to truncate it
+    return [index + len(params)] + get_params(params, num, defaults, names, text[index:index + ERR_TEXT_LEN + 1])
+
+def _get_params_re(param, num):
+    if (param, num) not in _params_re:
+        _params_re[(param, num)] = re.compile(PARAMS.format(param, num - 1))
+    return _params_re[(param, num)]
 
 # API
 def parse_strings(text, index=0, num=0, defaults=()):
@@ -466,8 +477,8 @@ def get_params(param_string, num, defaults, names, text, safe=True):
         if params:
             raise MissingParameterError("Not enough parameters (expected {}): '{}'".format(req, param_string))
         if text:
-            if len(text) > 10:
-                text = text[:10] + '...'
+            if len(text) > ERR_TEXT_LEN:
+                text = text[:ERR_TEXT_LEN] + '...'
             raise MissingParameterError(f"No parameters (expected {req}): '{text}'")
         raise MissingParameterError("No parameters (expected {})".format(req))
     elif None in params:
@@ -519,10 +530,12 @@ def get_macros(writer):
         '#VERSION': parse_version,
         '#WHILE': partial(parse_while, writer)
     }
-    for name, method in inspect.getmembers(writer, inspect.ismethod):
+    for name in dir(writer):
         match = RE_MACRO_METHOD.match(name)
         if match:
-            macros['#' + match.group(1).upper()] = method
+            method = getattr(writer, name)
+            if inspect.ismethod(method):
+                macros['#' + match.group(1).upper()] = method
     return macros
 
 def expand_macros(writer, text, *cwd):
@@ -1527,10 +1540,10 @@ def parse_while(writer, text, index, *cwd):
     expr = f'({expr})'
     end, body = parse_strings(text, end, 1)
     writer.sep_blocks = False
-    output = ''
+    output = []
     while 1:
         if not parse_ints(expr, 0, 1, fields=writer.fields)[1]:
             break
-        output += writer.expand(body, *cwd).strip()
+        output.append(writer.expand(body, *cwd).strip())
     writer.sep_blocks = True
-    return end, output
+    return end, ''.join(output)
@@ -18,6 +18,7 @@ import sys
 import os
 import argparse
 import hashlib
+import shutil
 import tempfile
 import zipfile
 from urllib.request import Request, urlopen
@@ -782,11 +783,7 @@ def _get_tape(urlstring, user_agent, member):
         r = Request(urlstring, headers={'User-Agent': user_agent})
         u = urlopen(r, timeout=30)
         f = tempfile.NamedTemporaryFile(prefix='tap2sna-')
-        while 1:
-            data = bytearray(u.read(4096))
-            if not data:
-                break
-            f.write(data)
+        shutil.copyfileobj(u, f)
     else:
         f = open_file(urlstring, 'rb')
 
@@ -1073,8 +1070,12 @@ def make_snapshot(url, options, outfile, config):
         outfile = os.path.join(options.output_dir, outfile)
     _write_snapshot(ram, options, outfile)
 
-def main(args):
-    config = get_config('tap2sna')
+_parser = None
+
+def _get_parser():
+    global _parser
+    if _parser is not None:
+        return _parser
     parser = SkoolKitArgumentParser(
         usage='\n  tap2sna.py [options] INPUT [OUTFILE]\n  tap2sna.py @FILE [args]',
         description="Convert a TAP or TZX file (which may be inside a zip archive) into an SZX or Z80 snapshot. "
@@ -1122,6 +1123,12 @@ def main(args):
                        help="Set the User-Agent header.")
     group.add_argument('-V', '--version', action='version', version='SkoolKit {}'.format(VERSION),
                        help='Show SkoolKit version number and exit.')
+    _parser = parser
+    return parser
+
+def main(args):
+    config = get_config('tap2sna')
+    parser = _get_parser()
     namespace, unknown_args = parser.parse_known_intermixed_args(args)
     if namespace.show_config:
         show_config('tap2sna', config)
@@ -1139,11 +1146,13 @@ def main(args):
         return
     if unknown_args or namespace.url is None:
         parser.exit(2, parser.format_help())
+    # Copy rather than append to namespace.reg, which may be the cached
+    # parser's default list
     if namespace.stack is not None:
-        namespace.reg.append('sp={}'.format(namespace.stack))
+        namespace.reg = namespace.reg + ['sp={}'.format(namespace.stack)]
     namespace.sim_load = not any(s.startswith('load=') for s in namespace.ram_ops)
     if not namespace.sim_load and namespace.start is not None:
-        namespace.reg.append('pc={}'.format(namespace.start))
+        namespace.reg = namespace.reg + ['pc={}'.format(namespace.start)]
     update_options('tap2sna', namespace, namespace.params, config)
     if namespace.outfile is None:
         for arg in args:
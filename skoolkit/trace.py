@@ -15,6 +15,7 @@
 # SkoolKit. If not, see <http://www.gnu.org/licenses/>.
 
 import argparse
+import sys
 import textwrap
 import time
 
@@ -50,13 +51,16 @@ class Tracer(PagingTracer):
         operations = 0
         tstates = registers[25]
         r = Registers(registers)
+        if trace_line:
+            trace_line += '\n'
+            write = sys.stdout.write
 
         while True:
             t0 = tstates
             if trace_line:
                 i = disassemble(memory, pc, prefix, byte_fmt, word_fmt)[0]
                 opcodes[memory[pc]]()
-                print(trace_line.format(pc=pc, i=i, r=r, t=t0))
+                write(trace_line.format(pc=pc, i=i, r=r, t=t0))
             else:
                 opcodes[memory[pc]]()
             tstates = registers[25]
@@ -88,8 +92,9 @@ class Tracer(PagingTracer):
     def write_port(self, registers, port, value):
         super().write_port(registers, port, value)
         if port % 2 == 0:
-            if self.spkr != value & 0x10:
-                self.spkr = value & 0x10
+            spkr = value & 0x10
+            if self.spkr != spkr:
+                self.spkr = spkr
                 self.out_times.append(registers[T])
 
 def rle(s, length):
@@ -207,9 +212,8 @@ def run(snafile, options, config):
         print(f'Instructions executed: {tracer.operations}')
         print(f'Simulation time: {rt:.03f}s (x{speed:.02f})')
     if options.audio:
-        delays = []
-        for i, t in enumerate(tracer.out_times[1:]):
-            delays.append(t - tracer.out_times[i])
+        out_times = tracer.out_times
+        delays = [cur - prev for prev, cur in zip(out_times, out_times[1:])]
         duration = sum(delays)
         print('Sound duration: {} T-states ({:.03f}s)'.format(duration, duration / 3500000))
         lines = textwrap.wrap(simplify(delays, options.depth), 78)
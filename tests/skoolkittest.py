@@ -16,6 +16,10 @@ from skoolkit import (bin2sna, bin2tap, rzxinfo, sna2img, skool2asm, skool2bin,
                       skool2ctl, skool2html, sna2ctl, sna2skool, snapinfo,
                       snapmod, tap2sna, tapinfo, trace)
 
+# Directory in which each test's working directory is created: the current
+# directory unless SKOOLKIT_TEST_TMPDIR is set (e.g. to a tmpfs mount)
+TEMPDIR_ROOT = os.environ.get('SKOOLKIT_TEST_TMPDIR', '')
+
 Z80_REGISTERS = {
     'a': 0, 'f': 1, 'bc': 2, 'c': 2, 'b': 3, 'hl': 4, 'l': 4, 'h': 5,
     'sp': 8, 'i': 10, 'r': 11, 'de': 13, 'e': 13, 'd': 14, '^bc': 15,
@@ -347,7 +351,7 @@ class SkoolKitTestCase(TestCase):
         self.tempfiles = []
         self.tempdirs = []
         self.cwd = os.getcwd()
-        os.chdir(self.make_directory())
+        os.chdir(self.make_directory(root=TEMPDIR_ROOT))
 
     def tearDown(self):
         os.chdir(self.cwd)
@@ -375,9 +379,9 @@ class SkoolKitTestCase(TestCase):
         self.out.clear()
         self.err.clear()
 
-    def make_directory(self, path=None):
+    def make_directory(self, path=None, root=''):
         if path is None:
-            tempdir = tempfile.mkdtemp(dir='')
+            tempdir = tempfile.mkdtemp(dir=root)
             self.tempdirs.append(os.path.abspath(tempdir))
             return os.path.relpath(tempdir)
         if path and not os.path.isdir(path):
@@ -44,6 +44,22 @@ class UdgTest(SkoolKitTestCase):
         self.assertEqual(udg.data, [170, 102, 30, 1, 0, 0, 0, 0])
         self.assertEqual(udg.mask, [170, 204, 240, 255, 255, 255, 255, 255])
 
+    def test_rotate_short_udg(self):
+        udg = Udg(0, [1, 2, 3, 4, 5], [255, 254, 253, 252, 251])
+        udg.rotate(1)
+        self.assertEqual(udg.data, [0, 0, 0, 0, 0, 192, 48, 168])
+        self.assertEqual(udg.mask, [248, 248, 248, 248, 248, 120, 152, 168])
+
+        udg = Udg(0, [1, 2, 3, 4, 5], [255, 254, 253, 252, 251])
+        udg.rotate(2)
+        self.assertEqual(udg.data, [160, 32, 192, 64, 128])
+        self.assertEqual(udg.mask, [223, 63, 191, 127, 255])
+
+        udg = Udg(0, [1, 2, 3, 4, 5], [255, 254, 253, 252, 251])
+        udg.rotate(3)
+        self.assertEqual(udg.data, [21, 12, 3, 0, 0, 0, 0, 0])
+        self.assertEqual(udg.mask, [21, 25, 30, 31, 31, 31, 31, 31])
+
     def test_copy(self):
         udg = Udg(23, [1] * 8)
         replica = udg.copy()
@@ -64,6 +80,7 @@ class UdgTest(SkoolKitTestCase):
         udg1 = Udg(1, [7] * 8)
         udg2 = Udg(1, [7] * 8)
         udg3 = Udg(2, [7] * 8)
+        self.assertTrue(udg1 == udg1)
         self.assertTrue(udg1 == udg2)
         self.assertFalse(udg1 == udg3)
         self.assertFalse(udg1 == 1)
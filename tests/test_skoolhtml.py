@@ -28,6 +28,19 @@ FONTDIR = 'images/font'
 SCRDIR = 'images/scr'
 UDGDIR = 'images/udgs'
 
+BUGS_HTML = join(REFERENCE_DIR, 'bugs.html')
+CHANGELOG_HTML = join(REFERENCE_DIR, 'changelog.html')
+FACTS_HTML = join(REFERENCE_DIR, 'facts.html')
+GLOSSARY_HTML = join(REFERENCE_DIR, 'glossary.html')
+POKES_HTML = join(REFERENCE_DIR, 'pokes.html')
+GLITCHES_HTML = join(GRAPHICS_DIR, 'glitches.html')
+GBUFFER_HTML = join(BUFFERS_DIR, 'gbuffer.html')
+MEMORY_MAP_HTML = join(MAPS_DIR, 'all.html')
+DATA_MAP_HTML = join(MAPS_DIR, 'data.html')
+MESSAGES_MAP_HTML = join(MAPS_DIR, 'messages.html')
+ROUTINES_MAP_HTML = join(MAPS_DIR, 'routines.html')
+UNUSED_MAP_HTML = join(MAPS_DIR, 'unused.html')
+
 REF_SECTIONS = {
     'Page_Bugs': defaults.get_section('Page:Bugs'),
     'Page_Facts': defaults.get_section('Page:Facts'),
@@ -193,6 +206,10 @@ PREV_UP_NEXT = """<table class="asm-navigation">
 </tr>
 </table>"""
 
+SCRIPT = '<script type="text/javascript" src="{}"></script>'
+
+STYLESHEET = '<link rel="stylesheet" type="text/css" href="{}" />'
+
 ERROR_PREFIX = 'Error while parsing #{0} macro'
 
 class MockSkoolParser:
@@ -303,6 +320,7 @@ class HtmlWriterTestCase(SkoolKitTestCase):
             skool_parser = SkoolParser(self.skoolfile, case=case, base=base, html=True,
                                        create_labels=create_labels, asm_labels=asm_labels,
                                        variables=variables)
+        self.game_name = basename(skool_parser.skoolfile)[:-6]
         self.odir = self.force_odir or self.make_directory()
         if mock_file_info:
             file_info = MockFileInfo()
@@ -5102,18 +5120,14 @@ class HtmlWriterOutputTestCase(HtmlWriterTestCase):
 
     def _assert_files_equal(self, d_fname, subs, index=False, trim=True):
         d_html_lines = self._read_file(d_fname, True)
-        body_lines = []
-        for line in subs['content'].split('\n'):
-            s_line = line.lstrip()
-            if s_line:
-                body_lines.append(s_line)
+        body_lines = [s for s in map(str.lstrip, subs['content'].split('\n')) if s]
         js = subs.get('js')
         if isinstance(subs['header'], str):
             subs['header'] = ('', subs['header'])
-        subs.setdefault('name', basename(self.skoolfile)[:-6])
+        subs.setdefault('name', self.game_name)
         subs.setdefault('path', '../')
         subs.setdefault('map', '{}maps/all.html'.format(subs['path']))
-        subs.setdefault('script', '<script type="text/javascript" src="{}"></script>'.format(js) if js else '')
+        subs.setdefault('script', SCRIPT.format(js) if js else '')
         subs.setdefault('title', subs['header'][1])
         subs.setdefault('logo', subs['name'])
         footer = subs.get('footer', BARE_FOOTER)
@@ -5153,7 +5167,7 @@ class HtmlWriterOutputTestCase(HtmlWriterTestCase):
 class HtmlOutputTest(HtmlWriterOutputTestCase):
     def _assert_title_equals(self, fname, title, header):
         html = self._read_file(fname)
-        name = self.skoolfile[:-6]
+        name = self.game_name
         self.assertIn('<title>{}: {}</title>'.format(name, title), html)
         self.assertIn('<td class="page-header">{}</td>'.format(header), html)
 
@@ -5661,7 +5675,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'header': 'Memory map',
             'content': content
         }
-        self._assert_files_equal(join(MAPS_DIR, 'all.html'), subs)
+        self._assert_files_equal(MEMORY_MAP_HTML, subs)
 
     def test_parameter_AsmSinglePage_containing_skool_macro(self):
         self._test_Game_parameter_containing_skool_macro('AsmSinglePage', '#IF({html})(0,1)', '0')
@@ -6242,7 +6256,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         ref = '[Bug:test:Test]\n<p>Hello</p>'
         writer = self._get_writer(ref=ref)
         writer.write_page('Bugs')
-        html = self._read_file(join(REFERENCE_DIR, 'bugs.html'))
+        html = self._read_file(BUGS_HTML)
         self.assertIn('<p>Hello</p>', html)
 
     def test_macro_font_text_parameter_is_not_html_escaped(self):
@@ -6332,8 +6346,8 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
     def test_write_index_two_maps(self):
         # Memory map, routines map
         files = [
-            join(MAPS_DIR, 'all.html'),
-            join(MAPS_DIR, 'routines.html')
+            MEMORY_MAP_HTML,
+            ROUTINES_MAP_HTML
         ]
         content = """
             <div class="section-header">Memory maps</div>
@@ -6347,9 +6361,9 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
     def test_write_index_three_maps(self):
         # Memory map, routines map, data map
         files = [
-            join(MAPS_DIR, 'all.html'),
-            join(MAPS_DIR, 'routines.html'),
-            join(MAPS_DIR, 'data.html')
+            MEMORY_MAP_HTML,
+            ROUTINES_MAP_HTML,
+            DATA_MAP_HTML
         ]
         content = """
             <div class="section-header">Memory maps</div>
@@ -6364,10 +6378,10 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
     def test_write_index_four_maps(self):
         # Memory map, routines map, data map, messages map
         files = [
-            join(MAPS_DIR, 'all.html'),
-            join(MAPS_DIR, 'routines.html'),
-            join(MAPS_DIR, 'data.html'),
-            join(MAPS_DIR, 'messages.html')
+            MEMORY_MAP_HTML,
+            ROUTINES_MAP_HTML,
+            DATA_MAP_HTML,
+            MESSAGES_MAP_HTML
         ]
         content = """
             <div class="section-header">Memory maps</div>
@@ -6593,7 +6607,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         writer.game_vars['LogoImage'] = logo_image_path
         self.write_bin_file(path=join(self.odir, GAMEDIR, logo_image_path))
         writer.write_index()
-        game = basename(self.skoolfile)[:-6]
+        game = self.game_name
         subs = {
             'name': game,
             'title': 'Index',
@@ -8070,7 +8084,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'header': 'Memory map',
             'content': content
         }
-        self._assert_files_equal(join(MAPS_DIR, 'all.html'), subs)
+        self._assert_files_equal(MEMORY_MAP_HTML, subs)
 
         # Routines map
         content = """
@@ -8094,7 +8108,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'header': 'Routines',
             'content': content
         }
-        self._assert_files_equal(join(MAPS_DIR, 'routines.html'), subs)
+        self._assert_files_equal(ROUTINES_MAP_HTML, subs)
 
         # Data map
         content = """
@@ -8130,7 +8144,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'header': 'Data',
             'content': content
         }
-        self._assert_files_equal(join(MAPS_DIR, 'data.html'), subs)
+        self._assert_files_equal(DATA_MAP_HTML, subs)
 
         # Messages map
         content = """
@@ -8154,7 +8168,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'header': 'Messages',
             'content': content
         }
-        self._assert_files_equal(join(MAPS_DIR, 'messages.html'), subs)
+        self._assert_files_equal(MESSAGES_MAP_HTML, subs)
 
         # Unused map
         content = """
@@ -8193,7 +8207,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'header': 'Unused addresses',
             'content': content
         }
-        self._assert_files_equal(join(MAPS_DIR, 'unused.html'), subs)
+        self._assert_files_equal(UNUSED_MAP_HTML, subs)
 
     def test_write_map_with_invalid_filename_template(self):
         ref = '[Paths]\nCodeFiles={address:q}.html'
@@ -8232,7 +8246,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'header': 'Memory map',
             'content': content
         }
-        self._assert_files_equal(join(MAPS_DIR, 'all.html'), subs)
+        self._assert_files_equal(MEMORY_MAP_HTML, subs)
 
     def test_write_map_with_custom_address_format_containing_skool_macro(self):
         ref = '[Game]\nAddress=#IF(1)(${address:04x})'
@@ -8264,7 +8278,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'header': 'Memory map',
             'content': content
         }
-        self._assert_files_equal(join(MAPS_DIR, 'all.html'), subs)
+        self._assert_files_equal(MEMORY_MAP_HTML, subs)
 
     def test_write_map_with_custom_asm_anchors(self):
         ref = '[Game]\nAddressAnchor={address:04x}'
@@ -8296,7 +8310,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'header': 'Memory map',
             'content': content
         }
-        self._assert_files_equal(join(MAPS_DIR, 'all.html'), subs)
+        self._assert_files_equal(MEMORY_MAP_HTML, subs)
 
     def test_write_map_with_custom_asm_anchor_containing_skool_macro(self):
         ref = '[Game]\nAddressAnchor=#MAP({base})({address:04x},10:{address})'
@@ -8328,7 +8342,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'header': 'Memory map',
             'content': content
         }
-        self._assert_files_equal(join(MAPS_DIR, 'all.html'), subs)
+        self._assert_files_equal(MEMORY_MAP_HTML, subs)
 
     def test_write_map_with_upper_case_asm_anchors_and_address_links(self):
         ref = """
@@ -8369,7 +8383,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'header': 'Memory map',
             'content': content
         }
-        self._assert_files_equal(join(MAPS_DIR, 'all.html'), subs)
+        self._assert_files_equal(MEMORY_MAP_HTML, subs)
 
     def test_write_map_with_invalid_asm_anchor(self):
         ref = '[Game]\nAddressAnchor={foo:04X}'
@@ -8471,7 +8485,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
 
         writer = self._get_writer(ref=ref, skool=skool)
         writer.write_map('MemoryMap')
-        self._assert_files_equal(join(MAPS_DIR, 'all.html'), subs)
+        self._assert_files_equal(MEMORY_MAP_HTML, subs)
 
     def test_write_map_with_single_page_template_and_upper_case_asm_anchors_and_address_link(self):
         ref = """
@@ -8512,7 +8526,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'header': 'Memory map',
             'content': content
         }
-        self._assert_files_equal(join(MAPS_DIR, 'all.html'), subs)
+        self._assert_files_equal(MEMORY_MAP_HTML, subs)
 
     def test_write_map_with_single_page_template_using_custom_path(self):
         path = 'disassembly.html'
@@ -8550,7 +8564,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
 
         writer = self._get_writer(ref=ref, skool=skool)
         writer.write_map('MemoryMap')
-        self._assert_files_equal(join(MAPS_DIR, 'all.html'), subs)
+        self._assert_files_equal(MEMORY_MAP_HTML, subs)
 
     def test_write_custom_map(self):
         skool = """
@@ -8952,7 +8966,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'header': 'Memory map',
             'content': content
         }
-        self._assert_files_equal(join(MAPS_DIR, 'all.html'), subs)
+        self._assert_files_equal(MEMORY_MAP_HTML, subs)
 
     def test_write_memory_map_with_intro(self):
         intro = 'This map is empty.'
@@ -8984,7 +8998,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         }
 
         writer.write_map('MemoryMap')
-        self._assert_files_equal(join(MAPS_DIR, 'all.html'), subs)
+        self._assert_files_equal(MEMORY_MAP_HTML, subs)
 
     def test_write_map_with_decimal_addresses_below_10000(self):
         skool = """
@@ -9030,7 +9044,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
                 'body_class': 'MemoryMap',
                 'content': exp_content
             }
-            self._assert_files_equal(join(MAPS_DIR, 'all.html'), subs)
+            self._assert_files_equal(MEMORY_MAP_HTML, subs)
 
     def test_write_map_with_includes_but_no_entry_types(self):
         ref = """
@@ -9167,14 +9181,14 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         title = 'Data blocks'
         header = 'Blocks of data'
         path = 'foo/bar/data.html'
-        ref = """
+        ref = f"""
             [Titles]
-            DataMap={}
+            DataMap={title}
             [PageHeaders]
-            DataMap={}
+            DataMap={header}
             [Paths]
-            DataMap={}
-        """.format(title, header, path)
+            DataMap={path}
+        """
         writer = self._get_writer(ref=ref, skool='b30000 DEFB 0')
         writer.write_map('DataMap')
         self._assert_title_equals(path, title, header)
@@ -9183,14 +9197,14 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         title = 'All the RAM'
         header = 'Every bit'
         path = 'memory_map.html'
-        ref = """
+        ref = f"""
             [Titles]
-            MemoryMap={}
+            MemoryMap={title}
             [PageHeaders]
-            MemoryMap={}
+            MemoryMap={header}
             [Paths]
-            MemoryMap={}
-        """.format(title, header, path)
+            MemoryMap={path}
+        """
         writer = self._get_writer(ref=ref, skool='c30000 RET')
         writer.write_map('MemoryMap')
         self._assert_title_equals(path, title, header)
@@ -9199,14 +9213,14 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         title = 'Strings'
         header = 'Text'
         path = 'text/strings.html'
-        ref = """
+        ref = f"""
             [Titles]
-            MessagesMap={}
+            MessagesMap={title}
             [PageHeaders]
-            MessagesMap={}
+            MessagesMap={header}
             [Paths]
-            MessagesMap={}
-        """.format(title, header, path)
+            MessagesMap={path}
+        """
         writer = self._get_writer(ref=ref, skool='t30000 DEFM "a"')
         writer.write_map('MessagesMap')
         self._assert_title_equals(path, title, header)
@@ -9215,14 +9229,14 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         title = 'All the code'
         header = 'Game code'
         path = 'mappage/code.html'
-        ref = """
+        ref = f"""
             [Titles]
-            RoutinesMap={}
+            RoutinesMap={title}
             [PageHeaders]
-            RoutinesMap={}
+            RoutinesMap={header}
             [Paths]
-            RoutinesMap={}
-        """.format(title, header, path)
+            RoutinesMap={path}
+        """
         writer = self._get_writer(ref=ref, skool='c30000 RET')
         writer.write_map('RoutinesMap')
         self._assert_title_equals(path, title, header)
@@ -9231,14 +9245,14 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         title = 'Bytes of no use'
         header = 'Unused memory'
         path = 'unused_bytes.html'
-        ref = """
+        ref = f"""
             [Titles]
-            UnusedMap={}
+            UnusedMap={title}
             [PageHeaders]
-            UnusedMap={}
+            UnusedMap={header}
             [Paths]
-            UnusedMap={}
-        """.format(title, header, path)
+            UnusedMap={path}
+        """
         writer = self._get_writer(ref=ref, skool='u30000 DEFB 0')
         writer.write_map('UnusedMap')
         self._assert_title_equals(path, title, header)
@@ -9782,20 +9796,20 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'body_class': 'Changelog',
             'content': content
         }
-        self._assert_files_equal(join(REFERENCE_DIR, 'changelog.html'), subs)
+        self._assert_files_equal(CHANGELOG_HTML, subs)
 
     def test_write_changelog_with_custom_title_and_header_and_path(self):
         title = 'Log of changes'
         header = 'What has changed?'
         path = 'changes/log.html'
-        ref = """
+        ref = f"""
             [Titles]
-            Changelog={}
+            Changelog={title}
             [PageHeaders]
-            Changelog={}
+            Changelog={header}
             [Paths]
-            Changelog={}
-        """.format(title, header, path)
+            Changelog={path}
+        """
         writer = self._get_writer(ref=ref, skool='')
         writer.write_page('Changelog')
         self._assert_title_equals(path, title, header)
@@ -9829,7 +9843,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'body_class': 'Changelog',
             'content': content
         }
-        self._assert_files_equal(join(REFERENCE_DIR, 'changelog.html'), subs)
+        self._assert_files_equal(CHANGELOG_HTML, subs)
 
     def test_write_glossary(self):
         ref = """
@@ -9871,20 +9885,20 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'body_class': 'Glossary',
             'content': content
         }
-        self._assert_files_equal(join(REFERENCE_DIR, 'glossary.html'), subs)
+        self._assert_files_equal(GLOSSARY_HTML, subs)
 
     def test_write_glossary_with_custom_title_and_header_and_path(self):
         title = 'Terminology'
         header = 'Terms'
         path = 'terminology.html'
-        ref = """
+        ref = f"""
             [Titles]
-            Glossary={}
+            Glossary={title}
             [PageHeaders]
-            Glossary={}
+            Glossary={header}
             [Paths]
-            Glossary={}
-        """.format(title, header, path)
+            Glossary={path}
+        """
         writer = self._get_writer(ref=ref, skool='')
         writer.write_page('Glossary')
         self._assert_title_equals(path, title, header)
@@ -10145,20 +10159,20 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'body_class': 'Bugs',
             'content': content
         }
-        self._assert_files_equal(join(REFERENCE_DIR, 'bugs.html'), subs)
+        self._assert_files_equal(BUGS_HTML, subs)
 
     def test_write_bugs_with_custom_title_and_header_and_path(self):
         title = 'Things that go wrong'
         header = 'Misfeatures'
         path = 'ref/wrongness.html'
-        ref = """
+        ref = f"""
             [Titles]
-            Bugs={}
+            Bugs={title}
             [PageHeaders]
-            Bugs={}
+            Bugs={header}
             [Paths]
-            Bugs={}
-        """.format(title, header, path)
+            Bugs={path}
+        """
         writer = self._get_writer(ref=ref, skool='')
         writer.write_page('Bugs')
         self._assert_title_equals(path, title, header)
@@ -10187,7 +10201,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'body_class': 'Bugs',
             'content': content
         }
-        self._assert_files_equal(join(REFERENCE_DIR, 'bugs.html'), subs)
+        self._assert_files_equal(BUGS_HTML, subs)
 
     def test_write_facts(self):
         ref = """
@@ -10229,20 +10243,20 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'body_class': 'Facts',
             'content': content
         }
-        self._assert_files_equal(join(REFERENCE_DIR, 'facts.html'), subs)
+        self._assert_files_equal(FACTS_HTML, subs)
 
     def test_write_facts_with_custom_title_and_header_and_path(self):
         title = 'Things that are true'
         header = 'Stuff you may not know'
         path = 'true_stuff.html'
-        ref = """
+        ref = f"""
             [Titles]
-            Facts={}
+            Facts={title}
             [PageHeaders]
-            Facts={}
+            Facts={header}
             [Paths]
-            Facts={}
-        """.format(title, header, path)
+            Facts={path}
+        """
         writer = self._get_writer(ref=ref, skool='')
         writer.write_page('Facts')
         self._assert_title_equals(path, title, header)
@@ -10271,7 +10285,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'body_class': 'Facts',
             'content': content
         }
-        self._assert_files_equal(join(REFERENCE_DIR, 'facts.html'), subs)
+        self._assert_files_equal(FACTS_HTML, subs)
 
     def test_write_pokes(self):
         html = """
@@ -10294,20 +10308,20 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'body_class': 'Pokes',
             'content': html
         }
-        self._assert_files_equal(join(REFERENCE_DIR, 'pokes.html'), subs)
+        self._assert_files_equal(POKES_HTML, subs)
 
     def test_write_pokes_with_custom_title_and_header_and_path(self):
         title = 'Hacking the game'
         header = 'Cheats'
         path = 'qux/xyzzy/hacks.html'
-        ref = """
+        ref = f"""
             [Titles]
-            Pokes={}
+            Pokes={title}
             [PageHeaders]
-            Pokes={}
+            Pokes={header}
             [Paths]
-            Pokes={}
-        """.format(title, header, path)
+            Pokes={path}
+        """
         writer = self._get_writer(ref=ref, skool='')
         writer.write_page('Pokes')
         self._assert_title_equals(path, title, header)
@@ -10336,7 +10350,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'body_class': 'Pokes',
             'content': content
         }
-        self._assert_files_equal(join(REFERENCE_DIR, 'pokes.html'), subs)
+        self._assert_files_equal(POKES_HTML, subs)
 
     def test_write_graphic_glitches(self):
         ref = '[GraphicGlitch:g0:Wrong arms]\nHello.'
@@ -10359,20 +10373,20 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'body_class': 'GraphicGlitches',
             'content': content
         }
-        self._assert_files_equal(join(GRAPHICS_DIR, 'glitches.html'), subs)
+        self._assert_files_equal(GLITCHES_HTML, subs)
 
     def test_write_graphic_glitches_with_custom_title_and_header_and_path(self):
         title = 'Bugs with the graphics'
         header = 'Graphical wrongness'
         path = 'cgi/graphic_bugs.html'
-        ref = """
+        ref = f"""
             [Titles]
-            GraphicGlitches={}
+            GraphicGlitches={title}
             [PageHeaders]
-            GraphicGlitches={}
+            GraphicGlitches={header}
             [Paths]
-            GraphicGlitches={}
-        """.format(title, header, path)
+            GraphicGlitches={path}
+        """
         writer = self._get_writer(ref=ref, skool='')
         writer.write_page('GraphicGlitches')
         self._assert_title_equals(path, title, header)
@@ -10401,7 +10415,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'body_class': 'GraphicGlitches',
             'content': content
         }
-        self._assert_files_equal(join(GRAPHICS_DIR, 'glitches.html'), subs)
+        self._assert_files_equal(GLITCHES_HTML, subs)
 
     def test_write_gsb_page(self):
         skool = """
@@ -10454,7 +10468,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'body_class': 'GameStatusBuffer',
             'content': content
         }
-        self._assert_files_equal(join(BUFFERS_DIR, 'gbuffer.html'), subs)
+        self._assert_files_equal(GBUFFER_HTML, subs)
 
     def test_write_gsb_page_with_includes(self):
         ref = """
@@ -10538,20 +10552,20 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
             'body_class': 'GameStatusBuffer',
             'content': content
         }
-        self._assert_files_equal(join(BUFFERS_DIR, 'gbuffer.html'), subs)
+        self._assert_files_equal(GBUFFER_HTML, subs)
 
     def test_write_gsb_page_with_custom_title_and_header_and_path(self):
         title = 'Workspace'
         header = 'Status buffer'
         path = 'game/status_buffer.html'
-        ref = """
+        ref = f"""
             [Titles]
-            GameStatusBuffer={}
+            GameStatusBuffer={title}
             [PageHeaders]
-            GameStatusBuffer={}
+            GameStatusBuffer={header}
             [Paths]
-            GameStatusBuffer={}
-        """.format(title, header, path)
+            GameStatusBuffer={path}
+        """
         writer = self._get_writer(ref=ref, skool='g32768 DEFB 0')
         writer.write_map('GameStatusBuffer')
         self._assert_title_equals(path, title, header)
@@ -10794,7 +10808,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         writer = self._get_writer(ref=ref)
         writer.write_page(page_id)
         js_path = basename(global_js)
-        self.assertEqual(self._read_file(page_id + '.html'), '<script type="text/javascript" src="{}"></script>'.format(js_path))
+        self.assertEqual(self._read_file(page_id + '.html'), SCRIPT.format(js_path))
 
     def test_write_page_with_multiple_global_js(self):
         js_files = ['js/global1.js', 'js.global2.js']
@@ -10814,8 +10828,8 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         writer.write_page(page_id)
         js_paths = [basename(js) for js in js_files]
         page = self._read_file(page_id + '.html', True)
-        self.assertEqual(page[0], '<script type="text/javascript" src="{}"></script>'.format(js_paths[0]))
-        self.assertEqual(page[1], '<script type="text/javascript" src="{}"></script>'.format(js_paths[1]))
+        self.assertEqual(page[0], SCRIPT.format(js_paths[0]))
+        self.assertEqual(page[1], SCRIPT.format(js_paths[1]))
 
     def test_write_page_with_single_local_js(self):
         page_id = 'Custom'
@@ -10831,7 +10845,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         writer = self._get_writer(ref=ref)
         writer.write_page(page_id)
         js_path = basename(js)
-        self.assertEqual(self._read_file(page_id + '.html'), '<script type="text/javascript" src="{}"></script>'.format(js_path))
+        self.assertEqual(self._read_file(page_id + '.html'), SCRIPT.format(js_path))
 
     def test_write_page_with_multiple_local_js(self):
         page_id = 'Custom'
@@ -10849,8 +10863,8 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         writer.write_page(page_id)
         js_paths = [basename(js) for js in js_files]
         page = self._read_file(page_id + '.html', True)
-        self.assertEqual(page[0], '<script type="text/javascript" src="{}"></script>'.format(js_paths[0]))
-        self.assertEqual(page[1], '<script type="text/javascript" src="{}"></script>'.format(js_paths[1]))
+        self.assertEqual(page[0], SCRIPT.format(js_paths[0]))
+        self.assertEqual(page[1], SCRIPT.format(js_paths[1]))
 
     def test_write_page_with_local_and_global_js(self):
         global_js_files = ['js/global1.js', 'js.global2.js']
@@ -10872,7 +10886,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         writer.write_page(page_id)
         page = self._read_file(page_id + '.html', True)
         for i, js in enumerate(global_js_files + local_js_files):
-            self.assertEqual(page[i], '<script type="text/javascript" src="{}"></script>'.format(basename(js)))
+            self.assertEqual(page[i], SCRIPT.format(basename(js)))
 
     def test_write_default_box_page_with_local_js(self):
         page_id = 'Custom'
@@ -10891,7 +10905,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         writer = self._get_writer(ref=ref)
         writer.write_page(page_id)
         js_path = basename(js)
-        self.assertEqual(self._read_file(page_id + '.html'), '<script type="text/javascript" src="{}"></script>'.format(js_path))
+        self.assertEqual(self._read_file(page_id + '.html'), SCRIPT.format(js_path))
 
     def test_write_list_items_box_page_with_local_js(self):
         page_id = 'Custom'
@@ -10911,7 +10925,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         writer = self._get_writer(ref=ref)
         writer.write_page(page_id)
         js_path = basename(js)
-        self.assertEqual(self._read_file(page_id + '.html'), '<script type="text/javascript" src="{}"></script>'.format(js_path))
+        self.assertEqual(self._read_file(page_id + '.html'), SCRIPT.format(js_path))
 
     def test_write_bullet_points_box_page_with_local_js(self):
         page_id = 'Custom'
@@ -10931,7 +10945,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         writer = self._get_writer(ref=ref)
         writer.write_page(page_id)
         js_path = basename(js)
-        self.assertEqual(self._read_file(page_id + '.html'), '<script type="text/javascript" src="{}"></script>'.format(js_path))
+        self.assertEqual(self._read_file(page_id + '.html'), SCRIPT.format(js_path))
 
     def test_write_page_with_single_css(self):
         css = 'css/game.css'
@@ -10949,7 +10963,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         writer = self._get_writer(ref=ref)
         writer.write_page(page_id)
         page = self._read_file(page_id + '.html')
-        self.assertEqual(page, '<link rel="stylesheet" type="text/css" href="{}" />'.format(basename(css)))
+        self.assertEqual(page, STYLESHEET.format(basename(css)))
 
     def test_write_page_with_multiple_css(self):
         css_files = ['css/game.css', 'css/foo.css']
@@ -10968,8 +10982,8 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         writer.write_page(page_id)
         page = self._read_file(page_id + '.html', True)
         css_paths = [basename(css) for css in css_files]
-        self.assertEqual(page[0], '<link rel="stylesheet" type="text/css" href="{}" />'.format(css_paths[0]))
-        self.assertEqual(page[1], '<link rel="stylesheet" type="text/css" href="{}" />'.format(css_paths[1]))
+        self.assertEqual(page[0], STYLESHEET.format(css_paths[0]))
+        self.assertEqual(page[1], STYLESHEET.format(css_paths[1]))
 
     def test_write_page_no_game_name(self):
         page_id = 'Custom'
@@ -10981,7 +10995,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         """.format(page_id)
         writer = self._get_writer(ref=ref, skool='')
         writer.write_page(page_id)
-        game_name = self.skoolfile[:-6]
+        game_name = self.game_name
         page = self._read_file(path, True)
         self.assertEqual(page[0], game_name)
 
@@ -11019,7 +11033,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         """.format(page_id, path)
         writer = self._get_writer(ref=ref, skool='')
         writer.write_page(page_id)
-        game_name = self.skoolfile[:-6]
+        game_name = self.game_name
         page = self._read_file(path, True)
         self.assertEqual(page[0], game_name)
 
@@ -11041,7 +11055,7 @@ class HtmlOutputTest(HtmlWriterOutputTestCase):
         logo_image = self.write_bin_file(path=join(writer.file_info.odir, logo_image_fname))
         writer.write_page(page_id)
         logo = writer.relpath(cwd, logo_image_fname)
-        game_name = self.skoolfile[:-6]
+        game_name = self.game_name
         page = self._read_file(path, True)
         self.assertEqual(page[0], '<img alt="{}" src="{}" />'.format(game_name, logo))
 
@@ -11206,7 +11220,7 @@ class HtmlTemplateTest(HtmlWriterOutputTestCase):
             'body_class': 'Changelog',
             'content': content
         }
-        self._assert_files_equal(join(REFERENCE_DIR, 'changelog.html'), subs)
+        self._assert_files_equal(CHANGELOG_HTML, subs)
 
     def test_page_with_custom_page_template(self):
         page_id = 'Custom'
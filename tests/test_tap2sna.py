@@ -1,5 +1,9 @@
 import hashlib
 import os
+import shutil
+import sys
+import tempfile
+import types
 from textwrap import dedent
 import urllib
 from zipfile import ZipFile
@@ -9,14 +13,48 @@ from unittest.mock import patch, Mock
 from skoolkittest import (SkoolKitTestCase, Z80_REGISTERS, create_data_block,
                           create_tap_header_block, create_tap_data_block,
                           create_tzx_header_block, create_tzx_data_block,
-                          create_tzx_turbo_data_block, create_tzx_pure_data_block)
-from skoolkit import tap2sna, VERSION, SkoolKitError
+                          create_tzx_turbo_data_block, create_tzx_pure_data_block,
+                          TEMPDIR_ROOT)
+from skoolkit import tap2sna, VERSION, SkoolKitError, get_word
 from skoolkit.config import COMMANDS
 from skoolkit.loadtracer import LoadTracer
 from skoolkit.snapshot import get_snapshot
 
 mock_memory = None
 
+TZX_HEADER = b'ZXTape!\x1a\x01\x14'
+
+# Registers after a simulated LOAD of 2 bytes at 32768 followed by a jump there
+SIM_LOAD_REG = frozenset(('^F=129', 'SP=65344', 'IX=32770', 'IY=23610', 'PC=32768'))
+
+# Offset and size of each register in a z80 header
+Z80_REG_LAYOUT = {r: (offset, len(r.lstrip('^'))) for r, offset in Z80_REGISTERS.items()}
+
+UNSUPPORTED_TZX_BLOCKS = (
+    (18, 0, 0, 0, 0), # 0x12 Pure Tone
+    (19, 2, 0, 0, 0, 0), # 0x13 Pulse sequence
+    (21,) + (0,) * 5 + (1, 0, 0, 0), # 0x15 Direct Recording
+    (24, 11) + (0,) * 14, # 0x18 CSW Recording
+    (25, 20) + (0,) * 23, # 0x19 Generalized Data Block
+    (32, 0, 0), # 0x20 Pause (silence) or 'Stop the Tape' command
+    (33, 1, 32), # 0x21 Group start
+    (34,), # 0x22 - Group end
+    (35, 0, 0), # 0x23 Jump to block
+    (36, 2, 0), # 0x24 Loop start
+    (37,), # 0x25 Loop end
+    (38, 1, 0, 0, 0), # 0x26 Call sequence
+    (39,), # 0x27 Return from sequence
+    (40, 5, 0, 1, 0, 0, 1, 32), # 0x28 Select block
+    (42, 0, 0, 0, 0), # 0x2A Stop the tape if in 48K mode
+    (43, 1, 0, 0, 0, 1), # 0x2B Set signal level
+    (48, 1, 65), # 0x30 Text description
+    (49, 0, 1, 66), # 0x31 Message block
+    (50, 4, 0, 1, 0, 1, 33), # 0x32 Archive info
+    (51, 1, 0, 0, 0), # 0x33 Hardware type
+    (53,) + (32,) * 16 + (1,) + (0,) * 4, # 0x35 Custom info block
+    (90,) + (0,) * 9, # 0x5A "Glue" block
+)
+
 class MockSimulator:
     def __init__(self, *args, **kwargs):
         global simulator
@@ -47,6 +85,20 @@ class MockSimulator:
         else:
             self.registers[25] += 1000 # T-states
 
+def get_basic_loader(start):
+    start_str = [ord(c) for c in str(start)]
+    return [
+        0, 10,            # Line 10
+        16, 0,            # Line length
+        239, 34, 34, 175, # LOAD ""CODE
+        58,               # :
+        249, 192, 176,    # RANDOMIZE USR VAL
+        34,               # "
+        *start_str,       # start address
+        34,               # "
+        13                # ENTER
+    ]
+
 def mock_make_snapshot(*args):
     global make_snapshot_args
     make_snapshot_args = args
@@ -144,42 +196,47 @@ class InterruptedTracer:
         raise KeyboardInterrupt()
 
 class Tap2SnaTest(SkoolKitTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Read-only tapes shared by tests that neither modify them nor write
+        # files alongside them
+        cls.tapdir = os.path.abspath(tempfile.mkdtemp(dir=TEMPDIR_ROOT))
+        cls.minimal_tap = cls._write_shared_tap('minimal.tap', [create_tap_data_block([0])])
+        cls.basic_loaders = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tapdir)
+        super().tearDownClass()
+
+    @classmethod
+    def _write_shared_tap(cls, name, blocks):
+        tapfile = os.path.join(cls.tapdir, name)
+        with open(tapfile, 'wb') as f:
+            f.write(b''.join(bytes(block) for block in blocks))
+        return tapfile
+
     def setUp(self):
         global snapshot, options, kbtracer, load_tracer, simulator
         super().setUp()
         snapshot = options = kbtracer = load_tracer = simulator = None
 
     def _write_tap(self, blocks, zip_archive=False, tap_name=None):
-        tap_data = []
-        for block in blocks:
-            tap_data.extend(block)
+        tap_data = b''.join(bytes(block) for block in blocks)
         if zip_archive:
-            archive_fname = self.write_bin_file(suffix='.zip')
-            with ZipFile(archive_fname, 'w') as archive:
-                archive.writestr(tap_name or 'game.tap', bytearray(tap_data))
-            return archive_fname
+            zip_data = BytesIO()
+            with ZipFile(zip_data, 'w') as archive:
+                archive.writestr(tap_name or 'game.tap', tap_data)
+            return self.write_bin_file(zip_data.getvalue(), suffix='.zip')
         return self.write_bin_file(tap_data, suffix='.tap')
 
     def _write_tzx(self, blocks):
-        tzx_data = [ord(c) for c in "ZXTape!"]
-        tzx_data.extend((26, 1, 20))
-        for block in blocks:
-            tzx_data.extend(block)
+        tzx_data = TZX_HEADER + b''.join(bytes(block) for block in blocks)
         return self.write_bin_file(tzx_data, suffix='.tzx')
 
     def _write_basic_loader(self, start, data, write=True, program='simloadbas', code='simloadbyt'):
-        start_str = [ord(c) for c in str(start)]
-        basic_data = [
-            0, 10,            # Line 10
-            16, 0,            # Line length
-            239, 34, 34, 175, # LOAD ""CODE
-            58,               # :
-            249, 192, 176,    # RANDOMIZE USR VAL
-            34,               # "
-            *start_str,       # start address
-            34,               # "
-            13                # ENTER
-        ]
+        basic_data = get_basic_loader(start)
         blocks = [
             create_tap_header_block(program, 10, len(basic_data), 0),
             create_tap_data_block(basic_data),
@@ -190,6 +247,15 @@ class Tap2SnaTest(SkoolKitTestCase):
             return self._write_tap(blocks), basic_data
         return blocks, basic_data
 
+    def _get_shared_basic_loader(self, start, data):
+        # The returned tape file is shared by all tests in the class, and so
+        # must not be modified
+        blocks, basic_data = self._write_basic_loader(start, data, False)
+        key = (start, tuple(data))
+        if key not in self.basic_loaders:
+            self.basic_loaders[key] = self._write_shared_tap(f'loader{len(self.basic_loaders)}.tap', blocks)
+        return self.basic_loaders[key], basic_data
+
     def _get_snapshot(self, start=16384, data=None, options='', load_options=None, blocks=None, tzx=False, page=None):
         if blocks is None:
             blocks = [create_tap_data_block(data)]
@@ -205,6 +271,25 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(error, '')
         return get_snapshot(z80file, page)
 
+    def _install_module(self, name, source):
+        module = types.ModuleType(name)
+        exec(compile(source, f'{name}.py', 'exec'), module.__dict__)
+        sys.modules[name] = module
+        self.addCleanup(sys.modules.pop, name, None)
+
+    def _assert_reg_values(self, z80file, reg_values):
+        with open(z80file, 'rb') as f:
+            z80_header = f.read(34)
+        for reg, exp_value in reg_values.items():
+            offset, size = Z80_REG_LAYOUT[reg]
+            if size == 1:
+                value = z80_header[offset]
+            else:
+                value = get_word(z80_header, offset)
+            self.assertEqual(value, exp_value, f'Register {reg}')
+            if reg == 'r' and exp_value & 128:
+                self.assertEqual(z80_header[12] & 1, 1)
+
     def _test_bad_spec(self, option, exp_error):
         tapfile = self._write_tap([create_tap_data_block([1])])
         z80fname = '{}/test.z80'.format(self.make_directory())
@@ -234,7 +319,7 @@ class Tap2SnaTest(SkoolKitTestCase):
 
     @patch.object(tap2sna, 'make_snapshot', mock_make_snapshot)
     def test_default_option_values(self):
-        self.run_tap2sna('in.tap {}/out.z80'.format(self.make_directory()))
+        self.run_tap2sna('in.tap out.z80')
         options = make_snapshot_args[1]
         self.assertIsNone(options.output_dir)
         self.assertIsNone(options.stack)
@@ -352,7 +437,7 @@ class Tap2SnaTest(SkoolKitTestCase):
 
     def test_option_d(self):
         odir = '{}/tap2sna'.format(self.make_directory())
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         z80_fname = 'test.z80'
         for option in ('-d', '--output-dir'):
             output, error = self.run_tap2sna('{} {} --ram load=1,16384 {} {}'.format(option, odir, tapfile, z80_fname))
@@ -382,7 +467,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'make_snapshot', mock_make_snapshot)
     def test_options_p_stack(self):
         for option, stack in (('-p', 24576), ('--stack', 49152)):
-            output, error = self.run_tap2sna('{} {} in.tap {}/out.z80'.format(option, stack, self.make_directory()))
+            output, error = self.run_tap2sna('{} {} in.tap out.z80'.format(option, stack))
             self.assertEqual(output, '')
             self.assertEqual(error, '')
             options = make_snapshot_args[1]
@@ -391,21 +476,21 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'make_snapshot', mock_make_snapshot)
     def test_options_p_stack_with_hex_address(self):
         for option, stack in (('-p', '0x6ff0'), ('--stack', '0x9ABC')):
-            output, error = self.run_tap2sna('{} {} in.tap {}/out.z80'.format(option, stack, self.make_directory()))
+            output, error = self.run_tap2sna('{} {} in.tap out.z80'.format(option, stack))
             self.assertEqual(output, '')
             self.assertEqual(error, '')
             options = make_snapshot_args[1]
             self.assertEqual(['sp={}'.format(int(stack[2:], 16))], options.reg)
 
     def test_option_p(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         z80file = '{}/out.z80'.format(self.make_directory())
         stack = 32768
         output, error = self.run_tap2sna(f'-p {stack} --ram load=1,16384 {tapfile} {z80file}')
         self.assertEqual(error, '')
         with open(z80file, 'rb') as f:
             z80_header = f.read(10)
-        self.assertEqual(z80_header[8] + 256 * z80_header[9], stack)
+        self.assertEqual(get_word(z80_header, 8), stack)
 
     @patch.object(tap2sna, 'get_config', mock_config)
     def test_option_show_config(self):
@@ -440,7 +525,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         start = 30000
         exp_reg = ['pc={}'.format(start)]
         for option in ('-s', '--start'):
-            output, error = self.run_tap2sna('{} {} --ram load=1,32768 in.tap {}/out.z80'.format(option, start, self.make_directory()))
+            output, error = self.run_tap2sna('{} {} --ram load=1,32768 in.tap out.z80'.format(option, start))
             self.assertEqual(output, '')
             self.assertEqual(error, '')
             options = make_snapshot_args[1]
@@ -451,21 +536,21 @@ class Tap2SnaTest(SkoolKitTestCase):
         start = 30000
         exp_reg = ['pc={}'.format(start)]
         for option in ('-s', '--start'):
-            output, error = self.run_tap2sna('{} 0x{:04X} --ram load=1,32768 in.tap {}/out.z80'.format(option, start, self.make_directory()))
+            output, error = self.run_tap2sna('{} 0x{:04X} --ram load=1,32768 in.tap out.z80'.format(option, start))
             self.assertEqual(output, '')
             self.assertEqual(error, '')
             options = make_snapshot_args[1]
             self.assertEqual(exp_reg, options.reg)
 
     def test_option_s(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         z80file = '{}/out.z80'.format(self.make_directory())
         start = 40000
         output, error = self.run_tap2sna(f'-s {start} --ram load=1,16384 {tapfile} {z80file}')
         self.assertEqual(error, '')
         with open(z80file, 'rb') as f:
             z80_header = f.read(34)
-        self.assertEqual(z80_header[32] + 256 * z80_header[33], start)
+        self.assertEqual(get_word(z80_header, 32), start)
 
     def test_option_tape_analysis_with_no_tape(self):
         output, error = self.run_tap2sna('--tape-analysis', catch_exit=2)
@@ -715,7 +800,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         mock_urlopen.return_value = BytesIO(bytes(create_tap_data_block([1])))
         url = 'http://example.com/test.tap'
         for option, user_agent in (('-u', 'Wget/1.18'), ('--user-agent', 'SkoolKit/6.3')):
-            output, error = self.run_tap2sna('{} {} --ram load=1,23296 {} {}/test.z80'.format(option, user_agent, url, self.make_directory()))
+            output, error = self.run_tap2sna('{} {} --ram load=1,23296 {} test.z80'.format(option, user_agent, url))
             self.assertTrue(output.startswith('Downloading {}\n'.format(url)))
             self.assertEqual(error, '')
             request = mock_urlopen.call_args[0][0]
@@ -757,11 +842,9 @@ class Tap2SnaTest(SkoolKitTestCase):
             def fix(snapshot):
                 snapshot[65280:] = list(range(256))
         """
-        module_dir = self.make_directory()
-        module_path = os.path.join(module_dir, 'ram.py')
-        module = self.write_text_file(dedent(ram_module).strip(), path=module_path)
+        self._install_module('ram', dedent(ram_module))
         blocks = [create_tap_data_block([0])]
-        load_options = f'--ram load=1,16384 --ram call={module_dir}:ram.fix'
+        load_options = '--ram load=1,16384 --ram call=ram.fix'
         snapshot = self._get_snapshot(load_options=load_options, blocks=blocks)
         self.assertEqual(list(range(256)), snapshot[65280:])
 
@@ -775,25 +858,16 @@ class Tap2SnaTest(SkoolKitTestCase):
         self._test_bad_spec(f'--ram call={module_dir}:ram.never', "No object named 'never' in module 'ram'")
 
     def test_ram_call_uncallable(self):
-        ram_module = "fix = None"
-        module_dir = self.make_directory()
-        module_path = os.path.join(module_dir, 'uncallable.py')
-        module = self.write_text_file(ram_module, path=module_path)
-        self._test_bad_spec(f'--ram call={module_dir}:uncallable.fix', "'NoneType' object is not callable")
+        self._install_module('uncallable', "fix = None")
+        self._test_bad_spec('--ram call=uncallable.fix', "'NoneType' object is not callable")
 
     def test_ram_call_function_with_no_arguments(self):
-        ram_module = "def fix(): pass"
-        module_dir = self.make_directory()
-        module_path = os.path.join(module_dir, 'noargs.py')
-        module = self.write_text_file(ram_module, path=module_path)
-        self._test_bad_spec(f'--ram call={module_dir}:noargs.fix', "fix() takes 0 positional arguments but 1 was given")
+        self._install_module('noargs', "def fix(): pass")
+        self._test_bad_spec('--ram call=noargs.fix', "fix() takes 0 positional arguments but 1 was given")
 
     def test_ram_call_function_with_two_positional_arguments(self):
-        ram_module = "def fix(snapshot, what): pass"
-        module_dir = self.make_directory()
-        module_path = os.path.join(module_dir, 'twoargs.py')
-        module = self.write_text_file(ram_module, path=module_path)
-        self._test_bad_spec(f'--ram call={module_dir}:twoargs.fix', "fix() missing 1 required positional argument: 'what'")
+        self._install_module('twoargs', "def fix(snapshot, what): pass")
+        self._test_bad_spec('--ram call=twoargs.fix', "fix() missing 1 required positional argument: 'what'")
 
     def test_ram_load(self):
         start = 16384
@@ -1165,31 +1239,8 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(data, snapshot[start:start + len(data)])
 
     def test_ram_load_tzx_with_unsupported_blocks(self):
-        blocks = []
-        blocks.append((18, 0, 0, 0, 0)) # 0x12 Pure Tone
-        blocks.append((19, 2, 0, 0, 0, 0)) # 0x13 Pulse sequence
-        blocks.append([21] + [0] * 5 + [1, 0, 0, 0]) # 0x15 Direct Recording
-        blocks.append([24, 11] + [0] * 14) # 0x18 CSW Recording
-        blocks.append([25, 20] + [0] * 23) # 0x19 Generalized Data Block
-        blocks.append((32, 0, 0)) # 0x20 Pause (silence) or 'Stop the Tape' command
-        blocks.append((33, 1, 32)) # 0x21 Group start
-        blocks.append((34,)) # 0x22 - Group end
-        blocks.append((35, 0, 0)) # 0x23 Jump to block
-        blocks.append((36, 2, 0)) # 0x24 Loop start
-        blocks.append((37,)) # 0x25 Loop end
-        blocks.append((38, 1, 0, 0, 0)) # 0x26 Call sequence
-        blocks.append((39,)) # 0x27 Return from sequence
-        blocks.append((40, 5, 0, 1, 0, 0, 1, 32)) # 0x28 Select block
-        blocks.append((42, 0, 0, 0, 0)) # 0x2A Stop the tape if in 48K mode
-        blocks.append((43, 1, 0, 0, 0, 1)) # 0x2B Set signal level
-        blocks.append((48, 1, 65)) # 0x30 Text description
-        blocks.append((49, 0, 1, 66)) # 0x31 Message block
-        blocks.append((50, 4, 0, 1, 0, 1, 33)) # 0x32 Archive info
-        blocks.append((51, 1, 0, 0, 0)) # 0x33 Hardware type
-        blocks.append([53] + [32] * 16 + [1] + [0] * 4) # 0x35 Custom info block
-        blocks.append([90] + [0] * 9) # 0x5A "Glue" block
         data = [2, 4, 6]
-        blocks.append(create_tzx_data_block(data))
+        blocks = [*UNSUPPORTED_TZX_BLOCKS, create_tzx_data_block(data)]
         start = 16388
         load_options = '--ram load={},{}'.format(len(blocks), start)
         snapshot = self._get_snapshot(load_options=load_options, blocks=blocks, tzx=True)
@@ -1205,8 +1256,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(cm.exception.args[0], f'Error while converting {tzxfile}: Unknown TZX block ID: 0x{block_id:X}')
 
     def test_default_register_values(self):
-        block = create_tap_data_block([0])
-        tapfile = self._write_tap([block])
+        tapfile = self.minimal_tap
         z80file = '{}/out.z80'.format(self.make_directory())
         exp_reg_values = {
             'a': 0, 'f': 0, 'bc': 0, 'de': 0, 'hl': 0, 'i': 63, 'r': 0,
@@ -1214,16 +1264,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         }
         output, error = self.run_tap2sna('--ram load=1,16384 {} {}'.format(tapfile, z80file))
         self.assertEqual(error, '')
-        with open(z80file, 'rb') as f:
-            z80_header = f.read(34)
-        for reg, exp_value in exp_reg_values.items():
-            offset = Z80_REGISTERS[reg]
-            size = len(reg) - 1 if reg.startswith('^') else len(reg)
-            if size == 1:
-                value = z80_header[offset]
-            else:
-                value = z80_header[offset] + 256 * z80_header[offset + 1]
-            self.assertEqual(value, exp_value)
+        self._assert_reg_values(z80file, exp_reg_values)
 
     def test_reg(self):
         block = create_tap_data_block([1])
@@ -1234,23 +1275,13 @@ class Tap2SnaTest(SkoolKitTestCase):
             {'^bc': 258, '^de': 515, '^hl': 65534, 'bc': 259, 'de': 516, 'hl': 65533},
             {'i': 13, 'ix': 1027, 'iy': 1284, 'pc': 1541, 'r': 23, 'sp': 32769}
         )
-        for reg_dict in reg_dicts:
-            reg_options = ' '.join(['--reg {}={}'.format(r, v) for r, v in reg_dict.items()])
-            z80file = '{}/out.z80'.format(self.make_directory())
-            output, error = self.run_tap2sna(f'--ram load=1,16384 {reg_options} {tapfile} {z80file}')
-            self.assertEqual(error, '')
-            with open(z80file, 'rb') as f:
-                z80_header = f.read(34)
-            for reg, exp_value in reg_dict.items():
-                offset = Z80_REGISTERS[reg]
-                size = len(reg) - 1 if reg.startswith('^') else len(reg)
-                if size == 1:
-                    value = z80_header[offset]
-                else:
-                    value = z80_header[offset] + 256 * z80_header[offset + 1]
-                self.assertEqual(value, exp_value)
-                if reg == 'r' and exp_value & 128:
-                    self.assertEqual(z80_header[12] & 1, 1)
+        for i, reg_dict in enumerate(reg_dicts):
+            z80file = f'out{i}.z80'
+            with self.subTest(reg=reg_dict):
+                reg_options = ' '.join([f'--reg {r}={v}' for r, v in reg_dict.items()])
+                output, error = self.run_tap2sna(f'--ram load=1,16384 {reg_options} {tapfile} {z80file}')
+                self.assertEqual(error, '')
+                self._assert_reg_values(z80file, reg_dict)
 
     def test_reg_hex_value(self):
         tapfile = self._write_tap([create_tap_data_block([1])])
@@ -1260,7 +1291,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(error, '')
         with open(z80fname, 'rb') as f:
             z80_header = f.read(4)
-        self.assertEqual(z80_header[2] + 256 * z80_header[3], reg_value)
+        self.assertEqual(get_word(z80_header, 2), reg_value)
 
     def test_reg_0x_hex_value(self):
         tapfile = self._write_tap([create_tap_data_block([1])])
@@ -1270,7 +1301,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(error, '')
         with open(z80fname, 'rb') as f:
             z80_header = f.read(6)
-        self.assertEqual(z80_header[4] + 256 * z80_header[5], reg_value)
+        self.assertEqual(get_word(z80_header, 4), reg_value)
 
     def test_reg_bad_value(self):
         self._test_bad_spec('--reg bc=A2', 'Cannot parse register value: bc=A2')
@@ -1287,8 +1318,8 @@ class Tap2SnaTest(SkoolKitTestCase):
     def test_sim_load(self):
         code_start = 32768
         code = [4, 5]
-        tapfile, basic_data = self._write_basic_loader(code_start, code)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        tapfile, basic_data = self._get_shared_basic_loader(code_start, code)
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'{tapfile} {z80file}')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1303,8 +1334,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(error, '')
         self.assertEqual(basic_data, snapshot[23755:23755 + len(basic_data)])
         self.assertEqual(code, snapshot[code_start:code_start + len(code)])
-        exp_reg = set(('^F=129', 'SP=65344', 'IX=32770', 'IY=23610', 'PC=32768'))
-        self.assertLessEqual(exp_reg, set(options.reg))
+        self.assertLessEqual(SIM_LOAD_REG, set(options.reg))
 
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_with_initial_code_block(self):
@@ -1315,7 +1345,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             create_tap_data_block(code)
         ]
         tapfile = self._write_tap(blocks)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'{tapfile} {z80file}')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1335,8 +1365,8 @@ class Tap2SnaTest(SkoolKitTestCase):
         code_start = 32768
         start = 32769
         code = [175, 201]
-        tapfile, basic_data = self._write_basic_loader(code_start, code)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        tapfile, basic_data = self._get_shared_basic_loader(code_start, code)
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'--start {start} {tapfile} {z80file}')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1384,7 +1414,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             create_tap_data_block(code)
         ]
         tapfile = self._write_tap(blocks)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'{tapfile} {z80file}')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1402,8 +1432,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(basic_data, snapshot[23755:23755 + len(basic_data)])
         self.assertEqual(ca_data, snapshot[23787:23787 + len(ca_data)])
         self.assertEqual(code, snapshot[code_start:code_start + len(code)])
-        exp_reg = set(('^F=129', 'SP=65344', 'IX=32770', 'IY=23610', 'PC=32768'))
-        self.assertLessEqual(exp_reg, set(options.reg))
+        self.assertLessEqual(SIM_LOAD_REG, set(options.reg))
 
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_with_number_array(self):
@@ -1435,7 +1464,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             create_tap_data_block(code)
         ]
         tapfile = self._write_tap(blocks)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'{tapfile} {z80file}')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1453,24 +1482,12 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(basic_data, snapshot[23755:23755 + len(basic_data)])
         self.assertEqual(na_data, snapshot[23786:23786 + len(na_data)])
         self.assertEqual(code, snapshot[code_start:code_start + len(code)])
-        exp_reg = set(('^F=129', 'SP=65344', 'IX=32770', 'IY=23610', 'PC=32768'))
-        self.assertLessEqual(exp_reg, set(options.reg))
+        self.assertLessEqual(SIM_LOAD_REG, set(options.reg))
 
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_with_headerless_block(self):
         code_start = 32768
-        code_start_str = [ord(c) for c in str(code_start)]
-        basic_data = [
-            0, 10,            # Line 10
-            16, 0,            # Line length
-            239, 34, 34, 175, # LOAD ""CODE
-            58,               # :
-            249, 192, 176,    # RANDOMIZE USR VAL
-            34,               # "
-            *code_start_str,  # start address
-            34,               # "
-            13                # ENTER
-        ]
+        basic_data = get_basic_loader(code_start)
         code = [
             221, 33, 0, 192,  # LD IX,49152
             17, 2, 0,         # LD DE,2
@@ -1488,7 +1505,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             create_tap_data_block(code2)
         ]
         tapfile = self._write_tap(blocks)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'{tapfile} {z80file}')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1511,18 +1528,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_with_overlong_blocks(self):
         code_start = 32768
-        code_start_str = [ord(c) for c in str(code_start)]
-        basic_data = [
-            0, 10,            # Line 10
-            16, 0,            # Line length
-            239, 34, 34, 175, # LOAD ""CODE
-            58,               # :
-            249, 192, 176,    # RANDOMIZE USR VAL
-            34,               # "
-            *code_start_str,  # start address
-            34,               # "
-            13                # ENTER
-        ]
+        basic_data = get_basic_loader(code_start)
         code = [4, 5]
         basic_header = create_tap_header_block("simloadbas", 10, len(basic_data), 0)
         basic_header[0] += 1
@@ -1543,7 +1549,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             code_data_block
         ]
         tapfile = self._write_tap(blocks)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'{tapfile} {z80file}')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1558,8 +1564,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(error, '')
         self.assertEqual(basic_data + [128], snapshot[23755:23755 + len(basic_data) + 1])
         self.assertEqual(code + [0], snapshot[code_start:code_start + len(code) + 1])
-        exp_reg = set(('^F=129', 'SP=65344', 'IX=32770', 'IY=23610', 'PC=32768'))
-        self.assertLessEqual(exp_reg, set(options.reg))
+        self.assertLessEqual(SIM_LOAD_REG, set(options.reg))
 
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_with_undersize_block(self):
@@ -1575,18 +1580,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             195, 86, 5,       # JP 1366
         ]
         code_start = 32768
-        code_start_str = [ord(c) for c in str(code_start)]
-        basic_data = [
-            0, 10,            # Line 10
-            16, 0,            # Line length
-            239, 34, 34, 175, # LOAD ""CODE
-            58,               # :
-            249, 192, 176,    # RANDOMIZE USR VAL
-            34,               # "
-            *code_start_str,  # start address
-            34,               # "
-            13                # ENTER
-        ]
+        basic_data = get_basic_loader(code_start)
         code2_data_block = create_tap_data_block(code2)
         blocks = [
             create_tap_header_block("simloadbas", 10, len(basic_data), 0),
@@ -1596,7 +1590,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             code2_data_block
         ]
         tapfile = self._write_tap(blocks)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'{tapfile} {z80file}')
 
         self.assertEqual(basic_data, snapshot[23755:23755 + len(basic_data)])
@@ -1622,18 +1616,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_skips_blocks_with_wrong_flag_byte(self):
         code_start = 32768
-        code_start_str = [ord(c) for c in str(code_start)]
-        basic_data = [
-            0, 10,            # Line 10
-            16, 0,            # Line length
-            239, 34, 34, 175, # LOAD ""CODE
-            58,               # :
-            249, 192, 176,    # RANDOMIZE USR VAL
-            34,               # "
-            *code_start_str,  # start address
-            34,               # "
-            13                # ENTER
-        ]
+        basic_data = get_basic_loader(code_start)
         code = [
             221, 33, 0, 0,    # 32768 LD IX,0
             17, 2, 0,         # 32772 LD DE,2
@@ -1654,7 +1637,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             create_tap_data_block(code2)
         ]
         tapfile = self._write_tap(blocks)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'{tapfile} {z80file}')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1682,7 +1665,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         code = [4, 5]
         blocks, basic_data = self._write_basic_loader(code_start, code, False)
         tapfile = self._write_tap(blocks + [[0]])
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'{tapfile} {z80file}')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1697,8 +1680,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(error, '')
         self.assertEqual(basic_data, snapshot[23755:23755 + len(basic_data)])
         self.assertEqual(code, snapshot[code_start:code_start + len(code)])
-        exp_reg = set(('^F=129', 'SP=65344', 'IX=32770', 'IY=23610', 'PC=32768'))
-        self.assertLessEqual(exp_reg, set(options.reg))
+        self.assertLessEqual(SIM_LOAD_REG, set(options.reg))
 
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_preserves_border_colour(self):
@@ -1726,7 +1708,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             create_tap_data_block(code)
         ]
         tapfile = self._write_tap(blocks)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'{tapfile} {z80file}')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1750,8 +1732,8 @@ class Tap2SnaTest(SkoolKitTestCase):
             201,              # 32771 RET
         ]
         start = 32771
-        tapfile, basic_data = self._write_basic_loader(code_start, code)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        tapfile, basic_data = self._get_shared_basic_loader(code_start, code)
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'--start {start} {tapfile} {z80file}')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1769,18 +1751,7 @@ class Tap2SnaTest(SkoolKitTestCase):
 
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_fast_load_does_not_overwrite_rom(self):
-        start_str = [ord(c) for c in "16384"]
-        basic_data = [
-            0, 10,            # Line 10
-            16, 0,            # Line length
-            239, 34, 34, 175, # LOAD ""CODE
-            58,               # :
-            249, 192, 176,    # RANDOMIZE USR VAL
-            34,               # "
-            *start_str,       # start address
-            34,               # "
-            13                # ENTER
-        ]
+        basic_data = get_basic_loader(16384)
         start = 16380
         code = [
             0x01, 0x02, 0x03, 0x04, # 16380 DEFB 1,2,3,4
@@ -1797,7 +1768,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             create_tap_data_block(code)
         ]
         tapfile = self._write_tap(blocks)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'--start 16395 {tapfile} {z80file}')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1818,18 +1789,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_fast_load_checks_parity(self):
         code_start = 32768
-        code_start_str = [ord(c) for c in str(code_start)]
-        basic_data = [
-            0, 10,            # Line 10
-            16, 0,            # Line length
-            239, 34, 34, 175, # LOAD ""CODE
-            58,               # :
-            249, 192, 176,    # RANDOMIZE USR VAL
-            34,               # "
-            *code_start_str,  # start address
-            34,               # "
-            13                # ENTER
-        ]
+        basic_data = get_basic_loader(code_start)
         code = [
             221, 33, 0, 192,  # 32768 LD IX,49152
             17, 2, 0,         # 32772 LD DE,2
@@ -1851,7 +1811,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             code2_block
         ]
         tapfile = self._write_tap(blocks)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         output, error = self.run_tap2sna(f'--start 32784 {tapfile} {z80file}')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1883,7 +1843,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         module = self.write_text_file(dedent(ram_module).strip(), path=module_path)
         code_start = 32768
         code = [4, 5]
-        tapfile, basic_data = self._write_basic_loader(code_start, code)
+        tapfile, basic_data = self._get_shared_basic_loader(code_start, code)
         output, error = self.run_tap2sna(f'--ram call={module_dir}:{module_name}.fix {tapfile} out.z80')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1898,14 +1858,13 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(error, '')
         self.assertEqual(basic_data, snapshot[23755:23755 + len(basic_data)])
         self.assertEqual([1, 2, 3, 4], snapshot[32768:32772])
-        exp_reg = set(('^F=129', 'SP=65344', 'IX=32770', 'IY=23610', 'PC=32768'))
-        self.assertLessEqual(exp_reg, set(options.reg))
+        self.assertLessEqual(SIM_LOAD_REG, set(options.reg))
 
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_with_ram_move(self):
         code_start = 32768
         code = [4, 5]
-        tapfile, basic_data = self._write_basic_loader(code_start, code)
+        tapfile, basic_data = self._get_shared_basic_loader(code_start, code)
         output, error = self.run_tap2sna(f'--ram move=32768,2,32770 {tapfile} out.z80')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1920,14 +1879,13 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(error, '')
         self.assertEqual(basic_data, snapshot[23755:23755 + len(basic_data)])
         self.assertEqual([4, 5, 4, 5], snapshot[32768:32772])
-        exp_reg = set(('^F=129', 'SP=65344', 'IX=32770', 'IY=23610', 'PC=32768'))
-        self.assertLessEqual(exp_reg, set(options.reg))
+        self.assertLessEqual(SIM_LOAD_REG, set(options.reg))
 
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_with_ram_poke(self):
         code_start = 32768
         code = [4, 5]
-        tapfile, basic_data = self._write_basic_loader(code_start, code)
+        tapfile, basic_data = self._get_shared_basic_loader(code_start, code)
         output, error = self.run_tap2sna(f'--ram poke=32768-32770-2,1 {tapfile} out.z80')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1942,14 +1900,13 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(error, '')
         self.assertEqual(basic_data, snapshot[23755:23755 + len(basic_data)])
         self.assertEqual([1, 5, 1], snapshot[32768:32771])
-        exp_reg = set(('^F=129', 'SP=65344', 'IX=32770', 'IY=23610', 'PC=32768'))
-        self.assertLessEqual(exp_reg, set(options.reg))
+        self.assertLessEqual(SIM_LOAD_REG, set(options.reg))
 
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_with_ram_sysvars(self):
         code_start = 32768
         code = [4, 5]
-        tapfile, basic_data = self._write_basic_loader(code_start, code)
+        tapfile, basic_data = self._get_shared_basic_loader(code_start, code)
         output, error = self.run_tap2sna(f'--ram sysvars {tapfile} out.z80')
         out_lines = output.strip().split('\n')
         exp_out_lines = [
@@ -1968,8 +1925,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual([206, 92], snapshot[23649:23651]) # WORKSP=23758
         self.assertEqual([206, 92], snapshot[23651:23653]) # STKBOT=23758
         self.assertEqual([206, 92], snapshot[23653:23655]) # STKEND=23758
-        exp_reg = set(('^F=129', 'SP=65344', 'IX=32770', 'IY=23610', 'PC=32768'))
-        self.assertLessEqual(exp_reg, set(options.reg))
+        self.assertLessEqual(SIM_LOAD_REG, set(options.reg))
 
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_with_initial_pause_block(self):
@@ -2004,7 +1960,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             create_tap_data_block(basic_data),
         ]
         tapfile = self._write_tap(blocks)
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         with self.assertRaises(SkoolKitError) as cm:
             self.run_tap2sna(f'{tapfile} {z80file}')
         out_lines = self.out.getvalue().strip().split('\n')
@@ -2092,7 +2048,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             1,           # CSW Data
         ]
         tzxfile = self._write_tzx([block])
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         with self.assertRaises(SkoolKitError) as cm:
             self.run_tap2sna(f'{tzxfile} {z80file}')
         self.assertEqual(cm.exception.args[0], f'Error while converting {tzxfile}: TZX CSW Recording (0x18) not supported')
@@ -2133,7 +2089,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             1,           # Number of data symbols in alphabet table
         ]
         tzxfile = self._write_tzx([block])
-        z80file = '{}/out.z80'.format(self.make_directory())
+        z80file = 'out.z80'
         with self.assertRaises(SkoolKitError) as cm:
             self.run_tap2sna(f'{tzxfile} {z80file}')
         self.assertEqual(cm.exception.args[0], f'Error while converting {tzxfile}: TZX Generalized Data Block (0x19) not supported')
@@ -2204,7 +2160,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             117,          # 32823 LD (HL),L   ; -> 32823 SCF
             48, 253,      # 32824 JR NC,32823
         ]
-        tapfile, basic_data = self._write_basic_loader(32820, code)
+        tapfile, basic_data = self._get_shared_basic_loader(32820, code)
         tracefile = '{}/sim-load.trace'.format(self.make_directory())
         output, error = self.run_tap2sna(f'--start 32826 -c trace={tracefile} {tapfile} out.z80')
         out_lines = output.strip().split('\n')
@@ -2260,8 +2216,7 @@ class Tap2SnaTest(SkoolKitTestCase):
             self.assertEqual(error, '')
 
     def test_default_state(self):
-        block = create_tap_data_block([0])
-        tapfile = self._write_tap([block])
+        tapfile = self.minimal_tap
         z80file = '{}/out.z80'.format(self.make_directory())
         output, error = self.run_tap2sna(f'--ram load=1,16384 {tapfile} {z80file}')
         self.assertEqual(error, '')
@@ -2273,8 +2228,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         self.assertEqual(z80_header[29] & 3, 1) # im=1
 
     def test_state_iff(self):
-        block = create_tap_data_block([0])
-        tapfile = self._write_tap([block])
+        tapfile = self.minimal_tap
         z80file = '{}/out.z80'.format(self.make_directory())
         iff_value = 0
         output, error = self.run_tap2sna(f'--ram load=1,16384 --state iff={iff_value} {tapfile} {z80file}')
@@ -2288,8 +2242,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         self._test_bad_spec('--state iff=fa', 'Cannot parse integer: iff=fa')
 
     def test_state_im(self):
-        block = create_tap_data_block([0])
-        tapfile = self._write_tap([block])
+        tapfile = self.minimal_tap
         z80file = '{}/out.z80'.format(self.make_directory())
         im_value = 2
         output, error = self.run_tap2sna(f'--ram load=1,16384 --state im={im_value} {tapfile} {z80file}')
@@ -2302,8 +2255,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         self._test_bad_spec('--state im=Q', 'Cannot parse integer: im=Q')
 
     def test_state_border(self):
-        block = create_tap_data_block([0])
-        tapfile = self._write_tap([block])
+        tapfile = self.minimal_tap
         z80file = '{}/out.z80'.format(self.make_directory())
         border = 4
         output, error = self.run_tap2sna(f'--ram load=1,16384 --state border={border} {tapfile} {z80file}')
@@ -2316,15 +2268,14 @@ class Tap2SnaTest(SkoolKitTestCase):
         self._test_bad_spec('--state border=x!', 'Cannot parse integer: border=x!')
 
     def test_state_tstates(self):
-        block = create_tap_data_block([0])
-        tapfile = self._write_tap([block])
+        tapfile = self.minimal_tap
         z80file = os.path.join(self.make_directory(), 'out.z80')
         tstates = 31445
         output, error = self.run_tap2sna(f'--ram load=1,16384 --state tstates={tstates} {tapfile} {z80file}')
         self.assertEqual(error, '')
         with open(z80file, 'rb') as f:
             z80_header = tuple(f.read(58))
-        t1 = (z80_header[55] + 256 * z80_header[56]) % 17472
+        t1 = get_word(z80_header, 55) % 17472
         t2 = (2 - z80_header[57]) % 4
         self.assertEqual(69887 - t2 * 17472 - t1, tstates)
 
@@ -2332,8 +2283,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         self._test_bad_spec('--state tstates=?', 'Cannot parse integer: tstates=?')
 
     def test_state_issue2(self):
-        block = create_tap_data_block([0])
-        tapfile = self._write_tap([block])
+        tapfile = self.minimal_tap
         for issue2 in (0, 1):
             z80file = os.path.join(self.make_directory(), 'out.z80')
             output, error = self.run_tap2sna(f'--ram load=1,16384 --state issue2={issue2} {tapfile} {z80file}')
@@ -2369,7 +2319,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'LoadTracer', MockLoadTracer)
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_config_parameter_default_values(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         output, error = self.run_tap2sna(tapfile)
         self.assertEqual(error, '')
         self.assertIsNone(kbtracer)
@@ -2401,7 +2351,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'LoadTracer', MockLoadTracer)
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_sim_load_config_parameters(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         trace_log = '{}/trace.log'.format(self.make_directory())
         params = (
             'accelerate-dec-a=2',
@@ -2459,7 +2409,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'LoadTracer', MockLoadTracer)
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_in_flags_parameter_bit_0(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         output, error = self.run_tap2sna(f'-c in-flags=1 {tapfile}')
         self.assertEqual(error, '')
         self.assertEqual(load_tracer.in_min_addr, 0x4000)
@@ -2471,7 +2421,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'LoadTracer', MockLoadTracer)
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_in_flags_parameter_bit_1(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         output, error = self.run_tap2sna(f'-c in-flags=2 {tapfile}')
         self.assertEqual(error, '')
         self.assertEqual(load_tracer.in_min_addr, 0x10000)
@@ -2483,7 +2433,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'LoadTracer', MockLoadTracer)
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_in_flags_parameter_bit_2(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         output, error = self.run_tap2sna(f'-c in-flags=4 {tapfile}')
         self.assertEqual(error, '')
         self.assertEqual(load_tracer.in_min_addr, 0x8000)
@@ -2495,7 +2445,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'LoadTracer', MockLoadTracer)
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_load_parameter_defaults_to_enter_for_128k(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         output, error = self.run_tap2sna(f'-c machine=128 {tapfile}')
         self.assertEqual(error, '')
         self.assertEqual(['ENTER'], kbtracer.load)
@@ -2504,7 +2454,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'LoadTracer', MockLoadTracer)
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_load_parameter_with_pc(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         output, error = self.run_tap2sna(f'-c load=PC=16384 {tapfile}')
         self.assertEqual(error, '')
         self.assertEqual(['ENTER'], kbtracer.load)
@@ -2515,7 +2465,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'LoadTracer', MockLoadTracer)
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_keyboard_tracer_config_for_48k(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         output, error = self.run_tap2sna(f'-c load=RUN {tapfile}')
         self.assertEqual(error, '')
         self.assertEqual(len(kbtracer.simulator.memory), 65536)
@@ -2528,7 +2478,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'LoadTracer', MockLoadTracer)
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_keyboard_tracer_config_for_128k(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         output, error = self.run_tap2sna(f'-c machine=128 {tapfile}')
         self.assertEqual(error, '')
         self.assertEqual(len(kbtracer.simulator.memory), 0x20000)
@@ -2554,7 +2504,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'LoadTracer', MockLoadTracer)
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_keyboard_tracer_timed_out(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         load = ' '.join(['a'] * 50)
         output, error = self.run_tap2sna(('-c', 'timeout=1', '-c', f'load={load}', tapfile))
         self.assertEqual(error, '')
@@ -2565,7 +2515,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'KeyboardTracer', InterruptedTracer)
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_interrupted_keyboard_tracer(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         output, error = self.run_tap2sna(f'-c load=RUN {tapfile}')
         self.assertEqual(error, '')
         self.assertEqual(output, 'Simulation stopped (interrupted): PC=4608\n')
@@ -2573,7 +2523,7 @@ class Tap2SnaTest(SkoolKitTestCase):
     @patch.object(tap2sna, 'LoadTracer', InterruptedTracer)
     @patch.object(tap2sna, '_write_snapshot', mock_write_snapshot)
     def test_interrupted_load_tracer(self):
-        tapfile = self._write_tap([create_tap_data_block([0])])
+        tapfile = self.minimal_tap
         output, error = self.run_tap2sna(tapfile)
         self.assertEqual(error, '')
         self.assertEqual(output, 'Simulation stopped (interrupted): PC=1541\n')
@@ -2861,7 +2811,7 @@ class Tap2SnaTest(SkoolKitTestCase):
         data = [2, 3]
         start = 17000
         url = 'http://example.com/test.tap'
-        output, error = self.run_tap2sna('--ram load=1,{} {} {}/test.z80'.format(start, url, self.make_directory()))
+        output, error = self.run_tap2sna('--ram load=1,{} {} test.z80'.format(start, url))
         self.assertTrue(output.startswith('Downloading {}\n'.format(url)))
         self.assertEqual(error, '')
         self.assertEqual(data, snapshot[start:start + len(data)])